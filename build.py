@@ -4,6 +4,7 @@ from pathlib import Path
 import shutil
 import sys
 from typing import List
+from typing import Tuple
 
 from Cython.Build import build_ext
 from Cython.Build import cythonize
@@ -21,12 +22,24 @@ PROFILING_MODE = bool(os.getenv("PROFILING_MODE", ""))
 ANNOTATION_MODE = bool(os.getenv("ANNOTATION_MODE", ""))
 # Skipping the build copy prevents copying built *.so files back into the source tree
 SKIP_BUILD_COPY = bool(os.getenv("SKIP_BUILD_COPY", ""))
+# Profile guided optimization (GCC), either 'generate' to build instrumented
+# extensions which record a profile when run, or 'use' to optimize with it
+PGO_MODE = os.getenv("PGO_MODE", "").lower()
+# Directory the PGO profile data is written to and read from
+PGO_PROFILE_DIR = os.path.abspath(os.getenv("PGO_PROFILE_DIR", "build/pgo"))
+# If NATIVE mode is enabled, optimize for the instruction set of the build machine
+NATIVE_MODE = bool(os.getenv("NATIVE_MODE", ""))
+
+if PGO_MODE not in ("", "generate", "use"):
+    raise ValueError(f"PGO_MODE must be 'generate' or 'use', was '{PGO_MODE}'")
 
 
 print(
     f"DEBUG_MODE={DEBUG_MODE}, "
     f"PROFILING_MODE={PROFILING_MODE}, "
-    f"ANNOTATION_MODE={ANNOTATION_MODE}"
+    f"ANNOTATION_MODE={ANNOTATION_MODE}, "
+    f"PGO_MODE={PGO_MODE or None}, "
+    f"NATIVE_MODE={NATIVE_MODE}"
 )
 
 ##########################
@@ -54,6 +67,33 @@ CYTHON_COMPILER_DIRECTIVES = {
 }
 
 
+def _build_compile_args() -> Tuple[List[str], List[str]]:
+    # Build the extra compiler and linker arguments (GCC compatible only)
+    compile_args = []
+    link_args = []
+    if sys.platform == "win32":
+        return compile_args, link_args
+
+    if PGO_MODE == "generate":
+        compile_args += [f"-fprofile-generate={PGO_PROFILE_DIR}"]
+        link_args += [f"-fprofile-generate={PGO_PROFILE_DIR}"]
+    elif PGO_MODE == "use":
+        # Modules not exercised by the profiling run have no profile data
+        compile_args += [
+            f"-fprofile-use={PGO_PROFILE_DIR}",
+            "-fprofile-correction",
+            "-Wno-missing-profile",
+            "-flto",
+            "-O3",
+        ]
+        link_args += ["-flto", "-O3"]
+
+    if NATIVE_MODE:
+        compile_args += ["-march=native"]
+
+    return compile_args, link_args
+
+
 def _build_extensions() -> List[Extension]:
     # Build Extensions to feed into cythonize()
     # Profiling requires special macro directives
@@ -62,12 +102,16 @@ def _build_extensions() -> List[Extension]:
     else:
         define_macros = None
 
+    extra_compile_args, extra_link_args = _build_compile_args()
+
     return [
         Extension(
             str(pyx.relative_to(".")).replace(os.path.sep, ".")[:-4],
             [str(pyx)],
             include_dirs=[".", np.get_include()],
             define_macros=define_macros,
+            extra_compile_args=extra_compile_args,
+            extra_link_args=extra_link_args,
         )
         for pyx in itertools.chain(
             Path("examples").rglob("*.pyx"),
@@ -119,14 +163,28 @@ def _copy_build_dir_to_project(cmd: build_ext) -> None:
         os.chmod(relative_extension, mode)
 
 
+def _clear_pgo_profile() -> None:
+    # Remove stale *.gcda profile data so a new profile is not merged into it
+    if os.path.isdir(PGO_PROFILE_DIR):
+        print(f"Removing stale PGO profile data in {PGO_PROFILE_DIR}")
+        shutil.rmtree(PGO_PROFILE_DIR)
+
+
 def build(setup_kwargs):
     """Construct the extensions and distribution."""  # noqa
+    if PGO_MODE == "generate":
+        _clear_pgo_profile()
+
     extensions = _build_extensions()
     distribution = _build_distribution(extensions)
 
     # Build and run the command
     cmd: build_ext = build_ext(distribution)
     cmd.parallel = os.cpu_count()
+    if PGO_MODE or NATIVE_MODE:
+        # The compiler flags are not part of the up-to-date check, so existing
+        # extensions must be rebuilt for the flags to take effect
+        cmd.force = True
     cmd.ensure_finalized()
     cmd.run()
 
@@ -565,11 +565,22 @@ cdef class BacktestEngine:
     cdef void _advance_time(self, datetime timestamp) except *:
         cdef TradingStrategy strategy
         cdef TimeEventHandler event_handler
+        cdef list clock_events
         cdef list time_events = []  # type: list[TimeEventHandler]
+        cdef int clocks_with_events = 0
         for strategy in self.trader.strategies_c():
             # noinspection PyUnresolvedReferences
-            time_events += strategy.clock.advance_time(timestamp)
-        for event_handler in sorted(time_events):
+            clock_events = strategy.clock.advance_time(timestamp)
+            if clock_events:
+                time_events.extend(clock_events)
+                clocks_with_events += 1
+
+        # Each clock returns its events chronologically, so an (in place)
+        # sort is only required when merging events from multiple clocks.
+        if clocks_with_events > 1:
+            time_events.sort()
+
+        for event_handler in time_events:
             self._test_clock.set_time(event_handler.event.timestamp)
             event_handler.handle()
         self._test_clock.set_time(timestamp)
@@ -20,6 +20,9 @@ from nautilus_trader.model.identifiers cimport Symbol
 from nautilus_trader.model.identifiers cimport TraderId
 
 
+cdef object parse_symbol(str value)
+
+
 cdef class IdentifierCache:
     cdef ObjectCache _cached_trader_ids
     cdef ObjectCache _cached_account_ids
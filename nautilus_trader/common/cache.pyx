@@ -16,6 +16,22 @@
 from nautilus_trader.core.correctness cimport Condition
 
 
+cdef object _parse_trader_id(str value):
+    return TraderId.from_str_c(value)
+
+
+cdef object _parse_account_id(str value):
+    return AccountId.from_str_c(value)
+
+
+cdef object _parse_strategy_id(str value):
+    return StrategyId.from_str_c(value)
+
+
+cdef object parse_symbol(str value):
+    return Symbol.from_str_c(value)
+
+
 cdef class IdentifierCache:
     """
     Provides an identifier cache.
@@ -25,10 +41,10 @@ cdef class IdentifierCache:
         """
         Initialize a new instance of the `IdentifierCache` class.
         """
-        self._cached_trader_ids = ObjectCache(TraderId, TraderId.from_str_c)
-        self._cached_account_ids = ObjectCache(AccountId, AccountId.from_str_c)
-        self._cached_strategy_ids = ObjectCache(StrategyId, StrategyId.from_str_c)
-        self._cached_symbols = ObjectCache(Symbol, Symbol.from_str_c)
+        self._cached_trader_ids = ObjectCache.from_parser_c(TraderId, _parse_trader_id)
+        self._cached_account_ids = ObjectCache.from_parser_c(AccountId, _parse_account_id)
+        self._cached_strategy_ids = ObjectCache.from_parser_c(StrategyId, _parse_strategy_id)
+        self._cached_symbols = ObjectCache.from_parser_c(Symbol, parse_symbol)
 
     cpdef TraderId get_trader_id(self, str value):
         """
@@ -16,6 +16,7 @@
 from cpython.datetime cimport datetime
 from cpython.datetime cimport timedelta
 from cpython.datetime cimport tzinfo
+from libc.stdint cimport int64_t
 
 from nautilus_trader.common.timer cimport LiveTimer
 from nautilus_trader.common.timer cimport TimeEvent
@@ -46,6 +47,7 @@ cdef class Clock:
     cpdef datetime local_now(self, tzinfo tz)
     cpdef timedelta delta(self, datetime time)
     cpdef double unix_time(self)
+    cpdef int64_t unix_time_ns(self)
     cpdef list timer_names(self)
     cpdef Timer timer(self, str name)
     cpdef void register_default_handler(self, handler: callable) except *
@@ -79,12 +81,21 @@ cdef class Clock:
 cdef class TestClock(Clock):
     cdef datetime _time
     cdef dict _pending_events
+    cdef list _timer_heap
+    cdef int64_t _timer_sequence
 
     cpdef void set_time(self, datetime to_time) except *
     cpdef list advance_time(self, datetime to_time)
+    cpdef list advance_time_ns(self, int64_t to_time_ns)
+    cdef void _prune_timer_heap(self) except *
+    cdef int64_t _next_other_time_ns(self) except *
+    cdef list _advance_time(self, datetime to_time, int64_t to_time_ns)
 
 
 cdef class LiveClock(Clock):
+    cdef int64_t _cached_now_us
+    cdef datetime _cached_now
+
     cpdef void _raise_time_event(self, LiveTimer timer) except *
 
     cdef inline void _handle_time_event(self, TimeEvent event) except *
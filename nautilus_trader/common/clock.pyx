@@ -13,20 +13,40 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from heapq import heapify
+from heapq import heappop
+from heapq import heappush
+from heapq import heapreplace
+
 import cython
 import numpy as np
 import pytz
 
 from cpython.datetime cimport datetime
+from cpython.datetime cimport datetime_new
+from cpython.datetime cimport import_datetime
 from cpython.datetime cimport timedelta
 from cpython.datetime cimport tzinfo
+from libc.stdint cimport INT64_MAX
+from libc.stdint cimport int64_t
+from libc.time cimport time_t
+from libc.time cimport tm
 
 from nautilus_trader.common.timer cimport TestTimer
 from nautilus_trader.common.timer cimport TimeEventHandler
 from nautilus_trader.common.uuid cimport UUIDFactory
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport UNIX_EPOCH
+from nautilus_trader.core.datetime cimport from_posix_ns
+from nautilus_trader.core.datetime cimport to_posix_ns
+from nautilus_trader.core.time cimport _PyTime_gmtime
 from nautilus_trader.core.time cimport unix_time
+from nautilus_trader.core.time cimport unix_time_ns
+
+
+import_datetime()
+
+cdef object _UTC = pytz.utc
 
 
 cdef class Clock:
@@ -109,6 +129,17 @@ cdef class Clock:
         """
         return unix_time()
 
+    cpdef int64_t unix_time_ns(self):
+        """
+        Return the current Unix time in nanoseconds from the system clock.
+
+        Returns
+        -------
+        int
+
+        """
+        return unix_time_ns()
+
     cpdef list timer_names(self):
         """
         The timer names held by the clock.
@@ -400,6 +431,8 @@ cdef class TestClock(Clock):
         super().__init__()
 
         self._time = initial_time
+        self._timer_heap = []  # type: list[list[int, int, TestTimer]]
+        self._timer_sequence = 0
         self.is_test_clock = True
 
     cpdef datetime utc_now(self):
@@ -452,27 +485,129 @@ cdef class TestClock(Clock):
         Condition.not_none(to_time, "to_time")
         Condition.true(to_time >= self._time, "to_time >= self._time")  # Ensure monotonic
 
-        cdef list event_handlers = []
+        if self.timer_count == 0 or to_time < self.next_event_time:
+            self._time = to_time
+            return []  # No timer events to iterate
+
+        return self._advance_time(to_time, to_posix_ns(to_time))
+
+    cpdef list advance_time_ns(self, int64_t to_time_ns):
+        """
+        Advance the clocks time to the given POSIX nanosecond timestamp.
+
+        Parameters
+        ----------
+        to_time_ns : int
+            The nanoseconds since the Unix epoch to advance the clock to.
+
+        Returns
+        -------
+        list[TimeEvent]
+            Sorted chronologically.
+
+        Raises
+        ------
+        ValueError
+            If to_time_ns is < the clocks current time.
+
+        """
+        cdef datetime to_time = from_posix_ns(to_time_ns)
+        Condition.true(to_time >= self._time, "to_time >= self._time")  # Ensure monotonic
 
         if self.timer_count == 0 or to_time < self.next_event_time:
             self._time = to_time
-            return event_handlers  # No timer events to iterate
+            return []  # No timer events to iterate
 
-        # Iterate timer events
+        return self._advance_time(to_time, to_time_ns)
+
+    cpdef void cancel_timer(self, str name) except *:
+        """
+        Cancel the timer corresponding to the given label.
+
+        Parameters
+        ----------
+        name : str
+            The name for the timer to cancel.
+
+        Notes
+        -----
+        Logs a warning if a timer with the given name is not found (it may have
+        already been cancelled).
+
+        """
+        Clock.cancel_timer(self, name)
+        self._prune_timer_heap()
+
+    cdef void _prune_timer_heap(self) except *:
+        # Cancelled timers are otherwise only dropped from the heap once they
+        # reach the top, so release them (and their callbacks) here when no
+        # timers remain or when they outnumber the live timers.
+        if self.timer_count == 0:
+            self._timer_heap.clear()
+        elif len(self._timer_heap) > 2 * self.timer_count:
+            self._timer_heap = [entry for entry in self._timer_heap if not entry[2].expired]
+            heapify(self._timer_heap)
+
+    cdef list _advance_time(self, datetime to_time, int64_t to_time_ns):
+        cdef list event_handlers = []
+
+        # Pop timers in order of their next event time (then creation order),
+        # this keeps the time events chronological without a final sort and
+        # only touches the timers which are due.
+        cdef list entry
         cdef TestTimer timer
-        cdef TimeEvent event
-        for timer in self._stack:
-            for event in timer.advance(to_time):
-                event_handlers.append(TimeEventHandler(event, timer.callback))
+        cdef int64_t next_other_ns
+        cdef bint removed = False
+        while self._timer_heap:
+            entry = self._timer_heap[0]
+            timer = entry[2]
+            if timer.expired:
+                # Timer was cancelled after being scheduled
+                heappop(self._timer_heap)
+                continue
+            if timer.next_time_ns > to_time_ns:
+                break  # No further timer events up to to_time
+
+            # Fire the timer for as long as it stays ahead of every other
+            # scheduled timer, then reorder the heap once.
+            next_other_ns = self._next_other_time_ns()
+            while True:
+                event_handlers.append(TimeEventHandler(timer.pop_next_event(), timer.callback))
+                if timer.expired or timer.next_time_ns > to_time_ns or timer.next_time_ns >= next_other_ns:
+                    break
 
-        # Remove expired timers
-        for timer in self._stack:
             if timer.expired:
-                self._remove_timer(timer)
+                heappop(self._timer_heap)
+                self._timers.pop(timer.name, None)
+                self._handlers.pop(timer.name, None)
+                removed = True
+            else:
+                entry[0] = timer.next_time_ns
+                if timer.next_time_ns >= next_other_ns:
+                    heapreplace(self._timer_heap, entry)
+
+        if removed:
+            self.timer_count = len(self._timers)
+            # The stack is only read by `_update_timing` after it is rebuilt
+            # on the next add or remove, so drop the expired timers now.
+            self._stack = None
 
-        self._update_timing()
+        # The heap top (if any) is now the next live timer
+        self.next_event_time = self._timer_heap[0][2].next_time if self._timer_heap else None
         self._time = to_time
-        return sorted(event_handlers)
+        return event_handlers
+
+    cdef int64_t _next_other_time_ns(self) except *:
+        # The earliest key after the heap top is held by one of its children
+        cdef Py_ssize_t length = len(self._timer_heap)
+        if length == 1:
+            return INT64_MAX
+
+        cdef int64_t next_ns = self._timer_heap[1][0]
+        if length > 2 and <int64_t>self._timer_heap[2][0] < next_ns:
+            next_ns = self._timer_heap[2][0]
+
+        return next_ns
 
     cdef Timer _create_timer(
         self,
@@ -483,7 +618,7 @@ cdef class TestClock(Clock):
         datetime start_time,
         datetime stop_time,
     ):
-        return TestTimer(
+        cdef TestTimer timer = TestTimer(
             name=name,
             callback=callback,
             interval=interval,
@@ -491,6 +626,13 @@ cdef class TestClock(Clock):
             stop_time=stop_time,
         )
 
+        # Schedule the timer, the sequence number breaks ties between timers
+        # with the same next time in the order they were set.
+        heappush(self._timer_heap, [timer.next_time_ns, self._timer_sequence, timer])
+        self._timer_sequence += 1
+
+        return timer
+
 
 cdef class LiveClock(Clock):
     """
@@ -523,7 +665,35 @@ cdef class LiveClock(Clock):
         # such as UTC. The preferred way of dealing with times is to always work
         # in UTC, converting to localtime only when generating output to be read
         # by humans.
-        return datetime.now(tz=pytz.utc)
+        #
+        # The datetime is constructed directly through the datetime C-API from
+        # the system clock, which avoids the attribute lookups and the Python
+        # level `pytz.utc.fromutc` call made by `datetime.now(tz=pytz.utc)`.
+        #
+        # As the datetime resolution is microseconds, repeated calls within the
+        # same microsecond return the previously constructed datetime.
+        cdef int64_t now_ns = unix_time_ns()
+        cdef int64_t now_us = now_ns // 1000
+        if now_us == self._cached_now_us and self._cached_now is not None:
+            return self._cached_now
+
+        cdef tm utc
+        _PyTime_gmtime(<time_t>(now_ns // 1_000_000_000), &utc)
+
+        cdef datetime now = datetime_new(
+            utc.tm_year + 1900,
+            utc.tm_mon + 1,
+            utc.tm_mday,
+            utc.tm_hour,
+            utc.tm_min,
+            utc.tm_sec,
+            now_us % 1_000_000,
+            _UTC,
+        )
+
+        self._cached_now_us = now_us
+        self._cached_now = now
+        return now
 
     cdef Timer _create_timer(
         self,
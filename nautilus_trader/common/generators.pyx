@@ -210,7 +210,7 @@ cdef class PositionIdGenerator(IdentifierGenerator):
             f"P-"
             f"{self._get_datetime_tag()}-"
             f"{self._id_tag_trader}-"
-            f"{strategy_id.tag.value}-"
+            f"{strategy_id.tag_c().value}-"
             f"{count}{'F' if flipped else ''}",
         )
 
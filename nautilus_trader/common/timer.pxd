@@ -15,6 +15,7 @@
 
 from cpython.datetime cimport datetime
 from cpython.datetime cimport timedelta
+from libc.stdint cimport int64_t
 
 from nautilus_trader.common.uuid cimport UUIDFactory
 from nautilus_trader.core.message cimport Event
@@ -41,10 +42,14 @@ cdef class Timer:
     """The timers callback function.\n\n:returns: `object`"""
     cdef readonly timedelta interval
     """The timers set interval.\n\n:returns: `timedelta`"""
+    cdef readonly int64_t interval_ns
+    """The timers set interval in nanoseconds.\n\n:returns: `int`"""
     cdef readonly datetime start_time
     """The timers set start time.\n\n:returns: `datetime`"""
     cdef readonly datetime next_time
     """The timers next alert timestamp.\n\n:returns: `datetime`"""
+    cdef readonly int64_t next_time_ns
+    """The timers next alert UNIX timestamp in nanoseconds.\n\n:returns: `int`"""
     cdef readonly datetime stop_time
     """The timers set stop time (if set).\n\n:returns: `datetime`"""
     cdef readonly bint expired
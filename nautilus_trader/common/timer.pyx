@@ -17,10 +17,13 @@ from threading import Timer as TimerThread
 
 from cpython.datetime cimport datetime
 from cpython.datetime cimport timedelta
+from libc.stdint cimport int64_t
 
 from nautilus_trader.common.timer cimport TimeEvent
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport format_iso8601
+from nautilus_trader.core.datetime cimport timedelta_to_ns
+from nautilus_trader.core.datetime cimport to_posix_ns
 from nautilus_trader.core.message cimport Event
 from nautilus_trader.core.uuid cimport UUID
 
@@ -143,8 +146,10 @@ cdef class Timer:
         self.name = name
         self.callback = callback
         self.interval = interval
+        self.interval_ns = timedelta_to_ns(interval)
         self.start_time = start_time
         self.next_time = start_time + interval
+        self.next_time_ns = to_posix_ns(self.next_time)
         self.stop_time = stop_time
         self.expired = False
 
@@ -192,6 +197,7 @@ cdef class Timer:
         Condition.not_none(now, "now")
 
         self.next_time += self.interval
+        self.next_time_ns += self.interval_ns
         if self.stop_time and now >= self.stop_time:
             self.expired = True
 
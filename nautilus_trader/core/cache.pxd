@@ -14,15 +14,22 @@
 # -------------------------------------------------------------------------------------------------
 
 
+ctypedef object(*ParserFunc)(str)
+
+
 cdef class ObjectCache:
     cdef dict _cache
     cdef object _parser
+    cdef ParserFunc _parser_c
 
     cdef readonly type type_key
     """The caches key type.\n\n:returns: `type`"""
     cdef readonly type type_value
     """The caches value type.\n\n:returns: `type`"""
 
+    @staticmethod
+    cdef ObjectCache from_parser_c(type type_value, ParserFunc parser)
+
     cpdef object get(self, str key)
     cpdef list keys(self)
     cpdef void clear(self) except *
@@ -20,6 +20,11 @@ The intended use is to reduce the creation of duplicate objects such as
 identifiers, which represent the same thing.
 """
 
+from sys import intern
+
+from cpython.dict cimport PyDict_GetItem
+from cpython.object cimport PyObject
+
 from nautilus_trader.core.correctness cimport Condition
 
 
@@ -44,6 +49,37 @@ cdef class ObjectCache:
         self.type_value = type_value
         self._cache = {}
         self._parser = parser
+        self._parser_c = NULL
+
+    @staticmethod
+    cdef ObjectCache from_parser_c(type type_value, ParserFunc parser):
+        """
+        Return an object cache which calls the given C parser function directly
+        on a cache miss, rather than through a Python callable.
+
+        Parameters
+        ----------
+        type_value : type
+            The type of the cached objects.
+        parser : ParserFunc
+            The C parser function to create an object for the cache.
+
+        Returns
+        -------
+        ObjectCache
+
+        """
+        Condition.not_none(type_value, "type_value")
+        Condition.true(parser != NULL, "parser != NULL")
+
+        cdef ObjectCache cache = ObjectCache.__new__(ObjectCache)
+        cache.type_key = str
+        cache.type_value = type_value
+        cache._cache = {}
+        cache._parser = None
+        cache._parser_c = parser
+
+        return cache
 
     cpdef list keys(self):
         """
@@ -72,12 +108,21 @@ cdef class ObjectCache:
             The cached object.
 
         """
+        # Borrowed reference lookup on the hot path, only a valid string can
+        # ever have been cached so validation is deferred until a miss.
+        cdef PyObject* cached = PyDict_GetItem(self._cache, key)
+        if cached != NULL:
+            return <object>cached
+
         Condition.valid_string(key, "key")
 
-        parsed = self._cache.get(key)
-        if parsed is None:
+        if self._parser_c != NULL:
+            parsed = self._parser_c(key)
+        else:
             parsed = self._parser(key)
-            self._cache[key] = parsed
+        # Interned keys allow subsequent lookups with interned strings to
+        # resolve on pointer comparison within the dict probe.
+        self._cache[intern(key)] = parsed
 
         return parsed
 
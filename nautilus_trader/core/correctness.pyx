@@ -21,6 +21,17 @@ to help ensure software correctness.
 from cpython.object cimport PyCallable_Check
 
 
+cdef inline bint _is_empty_or_whitespace(str argument):
+    # Equivalent to `argument == "" or argument.isspace()`, scans the code
+    # points in C and returns on the first non-whitespace character (normally
+    # the first) without the Python method call.
+    cdef Py_UCS4 c
+    for c in argument:
+        if not c.isspace():
+            return False
+    return True
+
+
 cdef class Condition:
     """
     Provides checking of function or method conditions. A condition is a
@@ -786,7 +797,7 @@ cdef class Condition:
         """
         Condition.not_none(argument, param, ex_type)
 
-        if argument != "" and not argument.isspace():
+        if not _is_empty_or_whitespace(argument):
             return  # Check passed
 
         raise make_exception(
@@ -14,12 +14,17 @@
 # -------------------------------------------------------------------------------------------------
 
 from cpython.datetime cimport datetime
+from cpython.datetime cimport timedelta
+from libc.stdint cimport int64_t
 
 cdef datetime UNIX_EPOCH
 
 
 cpdef long to_posix_ms(datetime timestamp) except *
 cpdef datetime from_posix_ms(long posix)
+cpdef int64_t to_posix_ns(datetime timestamp) except *
+cpdef datetime from_posix_ns(int64_t posix)
+cpdef int64_t timedelta_to_ns(timedelta delta) except *
 cpdef bint is_datetime_utc(datetime timestamp) except *
 cpdef bint is_tz_aware(time_object) except *
 cpdef bint is_tz_naive(time_object) except *
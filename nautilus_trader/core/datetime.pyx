@@ -25,12 +25,21 @@ import pytz
 from cpython.datetime cimport datetime
 from cpython.datetime cimport datetime_tzinfo
 from cpython.datetime cimport timedelta
+from cpython.datetime cimport timedelta_days
+from cpython.datetime cimport timedelta_microseconds
+from cpython.datetime cimport timedelta_seconds
 from cpython.unicode cimport PyUnicode_Contains
+from libc.stdint cimport int64_t
 
 from nautilus_trader.core.correctness cimport Condition
 
 # Unix epoch is the UTC time at 00:00:00 on 1/1/1970
 UNIX_EPOCH = datetime(1970, 1, 1, 0, 0, 0, 0, tzinfo=pytz.utc)
+cdef datetime _UNIX_EPOCH_NAIVE = datetime(1970, 1, 1, 0, 0, 0, 0)
+
+# The range of whole seconds and microseconds which fit in int64 nanoseconds
+cdef int64_t _MAX_NS_SECONDS = 9_223_372_036
+cdef int64_t _MAX_NS_MICROSECONDS = 9_223_372_036_854_775
 
 
 cpdef long to_posix_ms(datetime timestamp) except *:
@@ -67,6 +76,82 @@ cpdef datetime from_posix_ms(long posix):
     return UNIX_EPOCH + timedelta(milliseconds=posix)  # Round off thousands
 
 
+cpdef int64_t to_posix_ns(datetime timestamp) except *:
+    """
+    Returns the POSIX nanosecond timestamp from the given object.
+
+    Parameters
+    ----------
+    timestamp : datetime
+        The datetime for the timestamp (tz-naive datetimes are taken as UTC).
+
+    Returns
+    -------
+    int
+
+    Raises
+    ------
+    OverflowError
+        If timestamp is outside the int64 nanosecond range (years 1677 to 2262).
+
+    """
+    if datetime_tzinfo(timestamp) is None:
+        return timedelta_to_ns(timestamp - _UNIX_EPOCH_NAIVE)
+    return timedelta_to_ns(timestamp - UNIX_EPOCH)
+
+
+cpdef datetime from_posix_ns(int64_t posix):
+    """
+    Returns the datetime in UTC from the given POSIX nanosecond timestamp.
+
+    Parameters
+    ----------
+    posix : int
+        The timestamp to convert.
+
+    Returns
+    -------
+    datetime
+
+    Notes
+    -----
+    The `datetime` resolution is microseconds, so nanoseconds are truncated.
+
+    """
+    return UNIX_EPOCH + timedelta(microseconds=posix // 1000)
+
+
+cpdef int64_t timedelta_to_ns(timedelta delta) except *:
+    """
+    Returns the total nanoseconds of the given time delta.
+
+    Parameters
+    ----------
+    delta : timedelta
+        The time delta to convert.
+
+    Returns
+    -------
+    int
+
+    Raises
+    ------
+    OverflowError
+        If delta is outside the int64 nanosecond range (about 292 years).
+
+    """
+    # Integer arithmetic on the timedelta fields avoids the float rounding of
+    # total_seconds() at nanosecond resolution.
+    cdef int64_t seconds = <int64_t>timedelta_days(delta) * 86_400 + timedelta_seconds(delta)
+    cdef int64_t microseconds
+    if -_MAX_NS_SECONDS - 1 <= seconds <= _MAX_NS_SECONDS:
+        microseconds = seconds * 1_000_000 + timedelta_microseconds(delta)
+        if -_MAX_NS_MICROSECONDS <= microseconds <= _MAX_NS_MICROSECONDS:
+            return microseconds * 1000
+
+    raise OverflowError(f"The timedelta {delta} is outside the int64 nanosecond range")
+
+
 cpdef bint is_datetime_utc(datetime timestamp) except *:
     """
     Return a value indicating whether the given timestamp is timezone aware UTC.
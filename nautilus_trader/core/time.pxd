@@ -3,11 +3,14 @@ Cython implementation of (parts of) the standard library time module.
 """
 
 from libc.stdint cimport int64_t
+from libc.time cimport time_t
+from libc.time cimport tm
 
 cdef extern from "pytime.h":
     ctypedef int64_t _PyTime_t
     _PyTime_t _PyTime_GetSystemClock() nogil
     double _PyTime_AsSecondsDouble(_PyTime_t t) nogil
+    int _PyTime_gmtime(time_t t, tm *buf) except -1
 
 
 cdef inline double unix_time() nogil:
@@ -24,3 +27,8 @@ cdef inline double unix_time_ms() nogil:
 
     tic = _PyTime_GetSystemClock()
     return _PyTime_AsSecondsDouble(tic) * 1000
+
+
+cdef inline int64_t unix_time_ns() nogil:
+    # The _PyTime_t unit is nanoseconds
+    return _PyTime_GetSystemClock()
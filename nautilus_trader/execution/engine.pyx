@@ -111,7 +111,7 @@ cdef class ExecutionEngine(Component):
         self._clients = {}     # type: dict[Venue, ExecutionClient]
         self._strategies = {}  # type: dict[StrategyId, TradingStrategy]
         self._pos_id_generator = PositionIdGenerator(
-            id_tag_trader=database.trader_id.tag,
+            id_tag_trader=database.trader_id.tag_c(),
             clock=clock,
         )
         self._portfolio = portfolio
@@ -17,6 +17,8 @@ from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 
 
 cdef class ExponentialMovingAverage(MovingAverage):
+    cdef double _alpha_complement
+
     cdef readonly double alpha
     """The moving average alpha value.\n\n:returns: `double`"""
 
@@ -48,6 +48,7 @@ cdef class ExponentialMovingAverage(MovingAverage):
         super().__init__(period, params=[period], price_type=price_type)
 
         self.alpha = 2.0 / (period + 1.0)
+        self._alpha_complement = 1.0 - self.alpha
         self.value = 0
 
     cpdef void handle_quote_tick(self, QuoteTick tick) except *:
@@ -107,7 +108,7 @@ cdef class ExponentialMovingAverage(MovingAverage):
             self.value = value
 
         self._increment_count()
-        self.value = self.alpha * value + ((1.0 - self.alpha) * self.value)
+        self.value = self.alpha * value + (self._alpha_complement * self.value)
 
     cdef void _reset_ma(self) except *:
         pass  # Nothing else to reset
@@ -15,6 +15,7 @@
 
 
 cdef class Identifier:
+    cdef Py_hash_t _hash
     cdef readonly str value
     """The identifier value.\n\n:returns: `str`"""
 
@@ -48,20 +49,22 @@ cdef class IdTag(Identifier):
 
 
 cdef class TraderId(Identifier):
-    cdef readonly str name
-    """The name identifier of the trader.\n\n:returns: `str`"""
-    cdef readonly IdTag tag
-    """The order identifier tag of the trader.\n\n:returns: `IdTag`"""
+    cdef Py_ssize_t _tag_index
+    cdef IdTag _tag
+
+    cdef str name_c(self)
+    cdef IdTag tag_c(self)
 
     @staticmethod
     cdef TraderId from_str_c(str value)
 
 
 cdef class StrategyId(Identifier):
-    cdef readonly str name
-    """The name identifier of the strategy.\n\n:returns: `str`"""
-    cdef readonly IdTag tag
-    """The order identifier tag of the strategy.\n\n:returns: `str`"""
+    cdef Py_ssize_t _tag_index
+    cdef IdTag _tag
+
+    cdef str name_c(self)
+    cdef IdTag tag_c(self)
 
     @staticmethod
     cdef StrategyId null_c()
@@ -77,11 +80,12 @@ cdef class Issuer(Identifier):
 
 
 cdef class AccountId(Identifier):
-    cdef readonly Issuer issuer
-    """The account issuer.\n\n:returns: `Issuer`"""
-    cdef readonly Identifier identifier
-    """The account identifier value.\n\n:returns: `Identifier`"""
+    cdef Py_ssize_t _identifier_index
+    cdef Issuer _issuer
+    cdef Identifier _identifier
 
+    cdef Issuer issuer_c(self)
+    cdef Identifier identifier_c(self)
     cdef Venue issuer_as_venue(self)
 
     @staticmethod
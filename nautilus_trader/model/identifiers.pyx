@@ -13,11 +13,47 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import cython
+
 from nautilus_trader.core.correctness cimport Condition
 
 
+cdef extern from "Python.h":
+    Py_ssize_t PyUnicode_FindChar(
+        object str,
+        Py_UCS4 ch,
+        Py_ssize_t start,
+        Py_ssize_t end,
+        int direction,
+    ) except -2
+
+
 cdef str _NULL_ID = "NULL"
 
+# Venues are few in number and immutable, so a single shared instance is
+# handed out for each venue name parsed from a symbol or account identifier.
+# The pool is bounded as these strings can arrive from external input.
+cdef dict _VENUE_POOL = {}
+cdef Py_ssize_t _VENUE_POOL_CAPACITY = 1024
+
+
+cdef inline Venue _pooled_venue(str name):
+    cdef Venue venue = _VENUE_POOL.get(name)
+    if venue is None:
+        venue = Venue(name)
+        if len(_VENUE_POOL) < _VENUE_POOL_CAPACITY:
+            _VENUE_POOL[name] = venue
+
+    return venue
+
+
+cdef inline Py_ssize_t _find_delimiter(str value, Py_UCS4 delimiter) except -2:
+    # Single forward scan for the first delimiter (-1 if not found), avoids
+    # building an intermediate tuple or list as with partition or split.
+    return PyUnicode_FindChar(value, delimiter, 0, len(value), 1)
+
+
+@cython.freelist(1024)
 cdef class Identifier:
     """
     The abstract base class for all identifiers.
@@ -45,10 +81,14 @@ cdef class Identifier:
         self.value = value
 
     def __eq__(self, Identifier other) -> bool:
+        if self is other:
+            return True  # Identical object (common with cached identifiers)
         return self._is_subclass(type(other)) and self.value == other.value
 
     def __ne__(self, Identifier other) -> bool:
-        return not self == other
+        if self is other:
+            return False
+        return not (self._is_subclass(type(other)) and self.value == other.value)
 
     def __lt__(self, Identifier other) -> bool:
         return self.value < other.value
@@ -63,7 +103,11 @@ cdef class Identifier:
         return self.value >= other.value
 
     def __hash__(self) -> int:
-        return hash((type(self), self.value))
+        # Identifiers are immutable so the hash is computed once on first use,
+        # a zero value indicates the hash has not yet been computed.
+        if self._hash == 0:
+            self._hash = hash((type(self), self.value))
+        return self._hash
 
     def __str__(self) -> str:
         return self.value
@@ -111,8 +155,12 @@ cdef class Symbol(Identifier):
     cdef Symbol from_str_c(str value):
         Condition.valid_string(value, "value")
 
-        cdef tuple pieces = value.partition('.')
-        return Symbol(pieces[0], Venue(pieces[2]))
+        cdef Py_ssize_t index = _find_delimiter(value, ".")
+
+        if index < 0:
+            raise ValueError(f"The Symbol string value was malformed, was {value}")
+
+        return Symbol(value[:index], _pooled_venue(value[index + 1:]))
 
     @staticmethod
     def from_str(value: str) -> Symbol:
@@ -264,19 +312,53 @@ cdef class TraderId(Identifier):
         Condition.valid_string(tag, "tag")
         super().__init__(f"{name}-{tag}")
 
-        self.name = name
-        self.tag = IdTag(tag)
+        # The name and tag are held only as the identifier value and the index
+        # of the tag into it.
+        self._tag_index = len(name) + 1
+
+    cdef str name_c(self):
+        return self.value[:self._tag_index - 1]
+
+    cdef IdTag tag_c(self):
+        # Created on first access as the tag is not required by most identifiers
+        if self._tag is None:
+            self._tag = IdTag(self.value[self._tag_index:])
+        return self._tag
+
+    @property
+    def name(self):
+        """
+        The name identifier of the trader.
+
+        Returns
+        -------
+        str
+
+        """
+        return self.name_c()
+
+    @property
+    def tag(self):
+        """
+        The order identifier tag of the trader.
+
+        Returns
+        -------
+        IdTag
+
+        """
+        return self.tag_c()
 
     @staticmethod
     cdef TraderId from_str_c(str value):
         Condition.valid_string(value, "value")
 
-        cdef tuple pieces = value.partition('-')
+        cdef Py_ssize_t index = _find_delimiter(value, "-")
 
-        if len(pieces) != 3:
+        if index < 0:
             raise ValueError(f"The TraderId string value was malformed, was {value}")
 
-        return TraderId(name=pieces[0], tag=pieces[2])
+        return TraderId(name=value[:index], tag=value[index + 1:])
 
     @staticmethod
     def from_str(value: str) -> TraderId:
@@ -335,8 +417,39 @@ cdef class StrategyId(Identifier):
         Condition.valid_string(tag, "tag")
         super().__init__(f"{name}-{tag}")
 
-        self.name = name
-        self.tag = IdTag(tag)
+        self._tag_index = len(name) + 1
+
+    cdef str name_c(self):
+        return self.value[:self._tag_index - 1]
+
+    cdef IdTag tag_c(self):
+        if self._tag is None:
+            self._tag = IdTag(self.value[self._tag_index:])
+        return self._tag
+
+    @property
+    def name(self):
+        """
+        The name identifier of the strategy.
+
+        Returns
+        -------
+        str
+
+        """
+        return self.name_c()
+
+    @property
+    def tag(self):
+        """
+        The order identifier tag of the strategy.
+
+        Returns
+        -------
+        IdTag
+
+        """
+        return self.tag_c()
 
     @staticmethod
     cdef inline StrategyId null_c():
@@ -352,12 +465,12 @@ cdef class StrategyId(Identifier):
     cdef StrategyId from_str_c(str value):
         Condition.valid_string(value, "value")
 
-        cdef tuple pieces = value.partition('-')
+        cdef Py_ssize_t index = _find_delimiter(value, "-")
 
-        if len(pieces) != 3:
+        if index < 0:
             raise ValueError(f"The StrategyId string value was malformed, was {value}")
 
-        return StrategyId(name=pieces[0], tag=pieces[2])
+        return StrategyId(name=value[:index], tag=value[index + 1:])
 
     @staticmethod
     def from_str(value: str) -> StrategyId:
@@ -444,24 +557,61 @@ cdef class AccountId(Identifier):
             If identifier is not a valid string.
 
         """
+        Condition.valid_string(issuer, "issuer")
+        Condition.valid_string(identifier, "identifier")
         super().__init__(f"{issuer}-{identifier}")
 
-        self.issuer = Issuer(issuer)
-        self.identifier = Identifier(identifier)
+        # The issuer and identifier are held only as the identifier value and
+        # the index of the account identifier into it.
+        self._identifier_index = len(issuer) + 1
+
+    cdef Issuer issuer_c(self):
+        if self._issuer is None:
+            self._issuer = Issuer(self.value[:self._identifier_index - 1])
+        return self._issuer
+
+    cdef Identifier identifier_c(self):
+        if self._identifier is None:
+            self._identifier = Identifier(self.value[self._identifier_index:])
+        return self._identifier
 
     cdef Venue issuer_as_venue(self):
-        return Venue(self.issuer.value)
+        return _pooled_venue(self.value[:self._identifier_index - 1])
+
+    @property
+    def issuer(self):
+        """
+        The account issuer.
+
+        Returns
+        -------
+        Issuer
+
+        """
+        return self.issuer_c()
+
+    @property
+    def identifier(self):
+        """
+        The account identifier value.
+
+        Returns
+        -------
+        Identifier
+
+        """
+        return self.identifier_c()
 
     @staticmethod
     cdef AccountId from_str_c(str value):
         Condition.valid_string(value, "value")
 
-        cdef list pieces = value.split('-', maxsplit=1)
+        cdef Py_ssize_t index = _find_delimiter(value, "-")
 
-        if len(pieces) != 2:
+        if index < 0:
             raise ValueError(f"The AccountId string value was malformed, was {value}")
 
-        return AccountId(issuer=pieces[0], identifier=pieces[1])
+        return AccountId(issuer=value[:index], identifier=value[index + 1:])
 
     @staticmethod
     def from_str(value: str) -> AccountId:
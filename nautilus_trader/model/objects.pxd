@@ -18,6 +18,8 @@ from nautilus_trader.model.currency cimport Currency
 
 cdef class BaseDecimal:
     cdef object _value
+    cdef double _value_double
+    cdef bint _has_value_double
 
     cdef inline object _make_decimal_with_rounding(self, value, int precision, str rounding)
     cdef inline object _make_decimal(self, double value, int precision)
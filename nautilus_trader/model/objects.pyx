@@ -216,7 +216,7 @@ cdef class BaseDecimal:
         return round(self._value, ndigits)
 
     def __float__(self) -> float:
-        return float(self._value)
+        return self.as_double()
 
     def __int__(self) -> int:
         return int(self._value)
@@ -233,15 +233,15 @@ cdef class BaseDecimal:
     @staticmethod
     cdef inline object _extract_value(object obj):
         if isinstance(obj, BaseDecimal):
-            return obj.as_decimal()
+            return (<BaseDecimal>obj)._value
         return obj
 
     @staticmethod
     cdef inline bint _compare(a, b, int op) except *:
         if isinstance(a, BaseDecimal):
-            a = <BaseDecimal>a.as_decimal()
+            a = (<BaseDecimal>a)._value
         if isinstance(b, BaseDecimal):
-            b = <BaseDecimal>b.as_decimal()
+            b = (<BaseDecimal>b)._value
 
         return PyObject_RichCompareBool(a, b, op)
 
@@ -280,7 +280,12 @@ cdef class BaseDecimal:
         double
 
         """
-        return float(self._value)
+        # The value is immutable, so the (relatively expensive) conversion from
+        # Decimal is only made once.
+        if not self._has_value_double:
+            self._value_double = float(self._value)
+            self._has_value_double = True
+        return self._value_double
 
 
 cdef class Quantity(BaseDecimal):
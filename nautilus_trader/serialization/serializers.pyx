@@ -18,6 +18,7 @@ from cpython.datetime cimport datetime
 import msgpack
 
 from nautilus_trader.common.cache cimport IdentifierCache
+from nautilus_trader.common.cache cimport parse_symbol
 from nautilus_trader.core.cache cimport ObjectCache
 from nautilus_trader.core.constants cimport *  # str constants only
 from nautilus_trader.core.correctness cimport Condition
@@ -127,7 +128,7 @@ cdef class MsgPackOrderSerializer(OrderSerializer):
         """
         super().__init__()
 
-        self.symbol_cache = ObjectCache(Symbol, Symbol.from_str_c)
+        self.symbol_cache = ObjectCache.from_parser_c(Symbol, parse_symbol)
 
     cpdef bytes serialize(self, Order order):  # Can be None
         """
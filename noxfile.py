@@ -66,6 +66,15 @@ def coverage_and_annotation(session: Session) -> None:
     session.run("poetry", "install", env={"ANNOTATION_MODE": "true"})
 
 
+@nox.session
+def build_pgo(session: Session) -> None:
+    """Build with profile guided optimization from the performance tests."""
+    _setup_poetry(session, env={"PGO_MODE": "generate"})
+    # Run single-threaded so the recorded profile reflects a single process
+    _run_pytest(session, "tests/performance_tests/", parallel=False)
+    session.run("poetry", "install", env={"PGO_MODE": "use"})
+
+
 @nox.session
 def build_docs(session: Session) -> None:
     """Build documentation."""
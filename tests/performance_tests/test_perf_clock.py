@@ -18,6 +18,7 @@ import unittest
 
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.clock import TestClock
+from nautilus_trader.core.datetime import to_posix_ns
 from tests.test_kit.performance import PerformanceHarness
 from tests.test_kit.stubs import UNIX_EPOCH
 
@@ -25,6 +26,8 @@ from tests.test_kit.stubs import UNIX_EPOCH
 live_clock = LiveClock()
 test_clock = TestClock()
 
+_ONE_SEC_NS = 1_000_000_000
+
 
 class LiveClockPerformanceTests(unittest.TestCase):
 
@@ -38,6 +41,11 @@ class LiveClockPerformanceTests(unittest.TestCase):
         PerformanceHarness.profile_function(live_clock.unix_time, 100000, 1)
         # ~0.0ms / ~0.1μs / 103ns minimum of 100,000 runs @ 1 iteration each run.
 
+    @staticmethod
+    def test_unix_time_ns():
+        PerformanceHarness.profile_function(live_clock.unix_time_ns, 100000, 1)
+        # ~0.0ms / ~0.2μs / 176ns minimum of 100,000 runs @ 1 iteration each run.
+
 
 class TestClockHarness:
 
@@ -47,10 +55,8 @@ class TestClockHarness:
 
     @staticmethod
     def iteratively_advance_time():
-        test_time = UNIX_EPOCH
-        for _i in range(100000):
-            test_time += timedelta(seconds=1)
-        test_clock.advance_time(test_time)
+        # A single advance over 100,000 seconds (fires 100,000 time events)
+        test_clock.advance_time_ns(to_posix_ns(test_clock.utc_now()) + 100000 * _ONE_SEC_NS)
 
 
 class TestClockPerformanceTests(unittest.TestCase):
@@ -67,4 +73,4 @@ class TestClockPerformanceTests(unittest.TestCase):
 
         iterations = 1
         PerformanceHarness.profile_function(TestClockHarness.iteratively_advance_time, 1, iterations)
-        # ~320.1ms minimum of 1 runs @ 1 iteration each run. (100000 advances)
+        # ~305.7ms minimum of 1 runs @ 1 iteration each run. (100000 time events)
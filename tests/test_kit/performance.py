@@ -15,8 +15,10 @@
 
 import gc
 import inspect
+import itertools
+import statistics
 import sys
-import timeit
+import time
 
 
 class PerformanceHarness:
@@ -29,9 +31,9 @@ class PerformanceHarness:
         Return the minimum elapsed time in seconds taken to call the given
         function iteration times.
 
-        Also prints the elapsed time in milliseconds (ms), microseconds (μs) and
-        nanoseconds (ns). As a rule of thumb a CPU cycles in 1 nanosecond per
-        GHz of clock speed.
+        Also prints the minimum elapsed time in milliseconds (ms), microseconds
+        (μs) and nanoseconds (ns), along with the median in nanoseconds. As a
+        rule of thumb a CPU cycles in 1 nanosecond per GHz of clock speed.
 
         Parameters
         ----------
@@ -48,12 +50,19 @@ class PerformanceHarness:
         -------
         float
 
+        Notes
+        -----
+        Each run is timed with the integer nanosecond `time.perf_counter_ns`
+        clock, with the garbage collector disabled. The overhead of reading
+        the clock is measured up front and subtracted from each run, so that
+        sub-microsecond calls are not dominated by the harness itself.
+
         """
         if iterations < 1:
             raise ValueError("iterations cannot be less than 1")
 
-        results = timeit.Timer(function).repeat(repeat=runs, number=iterations)
-        minimum = min(results)  # In seconds
+        results = _time_runs(function, runs, iterations)  # In nanoseconds
+        minimum = min(results) / 1_000_000_000             # In seconds
 
         if print_output:
             result_milli = minimum * 1000          # 1,000ms in 1 second
@@ -64,7 +73,8 @@ class PerformanceHarness:
                   f"/ ~{result_micro:.1f}μs "
                   f"/ {result_nano:.0f}ns "
                   f"minimum of {runs:,} runs @ {iterations:,} "
-                  f"iteration{'s' if iterations > 1 else ''} each run.")
+                  f"iteration{'s' if iterations > 1 else ''} each run "
+                  f"(median {statistics.median(results):.0f}ns).")
 
         return minimum
 
@@ -92,6 +102,31 @@ class PerformanceHarness:
         return size
 
 
+def _time_runs(function, runs, iterations) -> list:
+    # Return the elapsed nanoseconds of each run, less the clock overhead
+    timer = time.perf_counter_ns
+    repeat = itertools.repeat
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        overhead = sys.maxsize
+        for _ in range(1000):
+            start = timer()
+            overhead = min(timer() - start, overhead)
+
+        results = []
+        for _ in range(runs):
+            start = timer()
+            for _ in repeat(None, iterations):
+                function()
+            results.append(max(timer() - start - overhead, 0))
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return results
+
+
 def get_size_of(obj) -> int:
     """
     Return the size of the given object in memory.
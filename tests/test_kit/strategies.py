@@ -83,6 +83,39 @@ class TickTock(TradingStrategy):
         self.store.append(event)
 
 
+class TimerRecorder(TradingStrategy):
+    """
+    A strategy to test correct sequencing of timers across strategy clocks.
+    """
+
+    def __init__(self, order_id_tag: str, intervals: list, store: list):
+        """
+        Initialize a new instance of the `TimerRecorder` class.
+
+        Parameters
+        ----------
+        order_id_tag : str
+            The unique order identifier tag for the strategy.
+        intervals : list[timedelta]
+            The intervals for the timers to set on start.
+        store : list
+            The store to append (strategy_id, timer_name, timestamp) to for
+            each time event received.
+
+        """
+        super().__init__(order_id_tag=order_id_tag)
+
+        self.intervals = intervals
+        self.store = store
+
+    def on_start(self):
+        for i, interval in enumerate(self.intervals):
+            self.clock.set_timer(name=f"Timer-{i}", interval=interval, handler=self.on_timer)
+
+    def on_timer(self, event):
+        self.store.append((self.id, event.name, event.timestamp))
+
+
 class EMACross(TradingStrategy):
     """
     A simple moving average cross example strategy.
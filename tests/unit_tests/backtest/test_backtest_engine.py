@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from datetime import timedelta
 import unittest
 
 from nautilus_trader.backtest.data_container import BacktestDataContainer
@@ -27,6 +28,7 @@ from nautilus_trader.model.objects import Money
 from nautilus_trader.trading.strategy import TradingStrategy
 from tests.test_kit.providers import TestDataProvider
 from tests.test_kit.providers import TestInstrumentProvider
+from tests.test_kit.strategies import TimerRecorder
 from tests.test_kit.stubs import TestStubs
 
 
@@ -92,3 +94,68 @@ class BacktestEngineTests(unittest.TestCase):
 
         # Assert
         self.assertTrue(True)  # No exception raised
+
+
+class BacktestEngineTimerTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        usdjpy = TestInstrumentProvider.default_fx_ccy(TestStubs.symbol_usdjpy())
+        self.data = BacktestDataContainer()
+        self.data.add_instrument(usdjpy)
+        self.data.add_bars(usdjpy.symbol, BarAggregation.MINUTE, PriceType.BID, TestDataProvider.usdjpy_1min_bid()[:200])
+        self.data.add_bars(usdjpy.symbol, BarAggregation.MINUTE, PriceType.ASK, TestDataProvider.usdjpy_1min_ask()[:200])
+        self.store = []
+
+    def create_engine(self, strategies):
+        engine = BacktestEngine(
+            data=self.data,
+            strategies=strategies,
+            use_tick_cache=True,
+        )
+
+        engine.add_exchange(
+            venue=Venue("SIM"),
+            oms_type=OMSType.HEDGING,
+            generate_position_ids=True,
+            starting_balances=[Money(1_000_000, USD)],
+            fill_model=FillModel(),
+        )
+
+        return engine
+
+    def test_run_with_timers_on_single_clock_dispatches_in_timestamp_order(self):
+        # Arrange
+        strategy = TimerRecorder("001", [timedelta(seconds=7), timedelta(seconds=11)], self.store)
+        engine = self.create_engine([strategy])
+
+        # Act
+        engine.run()
+        engine.dispose()
+
+        # Assert
+        timestamps = [timestamp for _, _, timestamp in self.store]
+        names = [name for _, name, _ in self.store]
+        self.assertTrue(len(timestamps) > 0)
+        self.assertEqual(sorted(timestamps), timestamps)
+        self.assertEqual(["Timer-0", "Timer-1", "Timer-0", "Timer-0", "Timer-1"], names[:5])
+
+    def test_run_with_timers_on_multiple_clocks_dispatches_in_timestamp_order(self):
+        # Arrange
+        strategy1 = TimerRecorder("001", [timedelta(seconds=7)], self.store)
+        strategy2 = TimerRecorder("002", [timedelta(seconds=11)], self.store)
+        engine = self.create_engine([strategy1, strategy2])
+
+        # Act
+        engine.run()
+        engine.dispose()
+
+        # Assert
+        timestamps = [timestamp for _, _, timestamp in self.store]
+        strategy_ids = [strategy_id for strategy_id, _, _ in self.store]
+        self.assertTrue(len(timestamps) > 0)
+        self.assertEqual(sorted(timestamps), timestamps)
+        self.assertEqual(
+            [strategy1.id, strategy2.id, strategy1.id, strategy1.id, strategy2.id],
+            strategy_ids[:5],
+        )
@@ -17,6 +17,7 @@ from datetime import datetime
 from datetime import timedelta
 import time
 import unittest
+import weakref
 
 import pytz
 
@@ -59,6 +60,25 @@ class TestClockTests(unittest.TestCase):
         self.assertEqual(UNIX_EPOCH + timedelta(minutes=1), clock.utc_now())
         self.assertEqual([], events)
 
+    def test_advance_time_ns_changes_time(self):
+        # Arrange
+        clock = TestClock(UNIX_EPOCH)
+
+        # Act
+        events = clock.advance_time_ns(60_000_000_000)
+
+        # Assert
+        self.assertEqual(UNIX_EPOCH + timedelta(minutes=1), clock.utc_now())
+        self.assertEqual([], events)
+
+    def test_advance_time_ns_given_time_in_past_raises_value_error(self):
+        # Arrange
+        clock = TestClock(UNIX_EPOCH + timedelta(minutes=1))
+
+        # Act
+        # Assert
+        self.assertRaises(ValueError, clock.advance_time_ns, 0)
+
     def test_advance_time_given_time_in_past_raises_value_error(self):
         # Arrange
         clock = TestClock(UNIX_EPOCH)
@@ -285,6 +305,125 @@ class TestClockTests(unittest.TestCase):
         self.assertEqual("TEST_TIMER2", clock.timer("TEST_TIMER2").name)
         self.assertEqual(2, clock.timer_count)
 
+    def test_advance_time_with_multiple_set_timers_returns_events_in_chronological_order(self):
+        # Arrange
+        clock = TestClock(UNIX_EPOCH)
+        handler = []
+
+        clock.set_timer("TEST_TIMER1", timedelta(minutes=1), handler=handler.append)
+        clock.set_timer("TEST_TIMER2", timedelta(seconds=30), handler=handler.append)
+
+        # Act
+        event_handlers = clock.advance_time(UNIX_EPOCH + timedelta(minutes=2))
+
+        # Assert
+        self.assertEqual(
+            ["TEST_TIMER2", "TEST_TIMER1", "TEST_TIMER2", "TEST_TIMER2", "TEST_TIMER1", "TEST_TIMER2"],
+            [e.event.name for e in event_handlers],
+        )
+        self.assertEqual(
+            sorted(e.event.timestamp for e in event_handlers),
+            [e.event.timestamp for e in event_handlers],
+        )
+
+    def test_advance_time_ns_with_set_timer_triggers_events(self):
+        # Arrange
+        clock = TestClock(UNIX_EPOCH)
+        handler = []
+        clock.set_timer("TEST_TIMER", timedelta(seconds=1), handler=handler.append)
+
+        # Act
+        event_handlers = clock.advance_time_ns(10_000_000_000)
+
+        # Assert
+        self.assertEqual(10, len(event_handlers))
+        self.assertEqual(UNIX_EPOCH + timedelta(seconds=10), event_handlers[-1].event.timestamp)
+        self.assertEqual(UNIX_EPOCH + timedelta(seconds=10), clock.utc_now())
+
+    def test_advance_time_after_cancel_timer_produces_no_events_for_cancelled_timer(self):
+        # Arrange
+        clock = TestClock(UNIX_EPOCH)
+        handler = []
+        clock.set_timer("TEST_TIMER1", timedelta(minutes=1), handler=handler.append)
+        clock.set_timer("TEST_TIMER2", timedelta(minutes=1), handler=handler.append)
+        clock.cancel_timer("TEST_TIMER1")
+
+        # Act
+        event_handlers = clock.advance_time(UNIX_EPOCH + timedelta(minutes=5))
+
+        # Assert
+        self.assertEqual(5, len(event_handlers))
+        self.assertTrue(all(e.event.name == "TEST_TIMER2" for e in event_handlers))
+        self.assertEqual(["TEST_TIMER2"], clock.timer_names())
+
+    def test_advance_time_with_tz_naive_times_triggers_events(self):
+        # Arrange
+        clock = TestClock(datetime(2020, 1, 1))
+        handler = []
+        clock.set_timer("TEST_TIMER", timedelta(minutes=1), handler=handler.append)
+
+        # Act
+        event_handlers = clock.advance_time(datetime(2020, 1, 1, 0, 5))
+
+        # Assert
+        self.assertEqual(5, len(event_handlers))
+        self.assertEqual(datetime(2020, 1, 1, 0, 5), event_handlers[-1].event.timestamp)
+
+    def test_advance_time_after_time_alert_expires_updates_next_event_time(self):
+        # Arrange
+        clock = TestClock(UNIX_EPOCH)
+        handler = []
+        clock.set_time_alert("TEST_ALERT", UNIX_EPOCH + timedelta(minutes=1), handler.append)
+        clock.set_timer("TEST_TIMER", timedelta(minutes=5), handler=handler.append)
+
+        # Act
+        event_handlers = clock.advance_time(UNIX_EPOCH + timedelta(minutes=2))
+
+        # Assert
+        self.assertEqual(["TEST_ALERT"], [e.event.name for e in event_handlers])
+        self.assertEqual(["TEST_TIMER"], clock.timer_names())
+        self.assertEqual(1, clock.timer_count)
+        self.assertEqual(UNIX_EPOCH + timedelta(minutes=5), clock.next_event_time)
+
+    def test_set_time_alert_beyond_int64_nanoseconds_raises_overflow_error(self):
+        # Arrange
+        clock = TestClock(UNIX_EPOCH)
+        handler = []
+        clock.set_timer("TEST_TIMER", timedelta(seconds=1), handler=handler.append)
+
+        # Act
+        # Assert
+        self.assertRaises(
+            OverflowError,
+            clock.set_time_alert,
+            "FAR_ALERT",
+            datetime(2300, 1, 1, tzinfo=pytz.utc),
+            handler.append,
+        )
+        event_handlers = clock.advance_time(UNIX_EPOCH + timedelta(seconds=1))
+        self.assertEqual(["TEST_TIMER"], clock.timer_names())
+        self.assertEqual(["TEST_TIMER"], [e.event.name for e in event_handlers])
+
+    def test_cancel_timer_releases_cancelled_timer_callbacks(self):
+        # Arrange
+        class Handler:
+            def __call__(self, event):
+                pass
+
+        clock = TestClock(UNIX_EPOCH)
+        handler = Handler()
+        handler_ref = weakref.ref(handler)
+        clock.set_timer("TEST_TIMER", timedelta(minutes=1), handler=handler)
+
+        # Act
+        clock.cancel_timer("TEST_TIMER")
+        clock.advance_time(UNIX_EPOCH + timedelta(seconds=30))
+        del handler
+
+        # Assert
+        self.assertIsNone(handler_ref())
+        self.assertEqual(0, clock.timer_count)
+
 
 class LiveClockTests(unittest.TestCase):
     def setUp(self):
@@ -313,6 +452,26 @@ class LiveClockTests(unittest.TestCase):
         self.assertEqual(datetime, type(result))
         self.assertEqual(pytz.utc, result.tzinfo)
 
+    def test_utc_now_is_consistent_with_system_time(self):
+        # Arrange
+        before = datetime.now(tz=pytz.utc)
+
+        # Act
+        result = self.clock.utc_now()
+
+        # Assert
+        after = datetime.now(tz=pytz.utc)
+        self.assertTrue(before <= result <= after)
+
+    def test_utc_now_repeated_calls_are_non_decreasing(self):
+        # Arrange
+        # Act
+        results = [self.clock.utc_now() for _ in range(1000)]
+
+        # Assert
+        self.assertEqual(sorted(results), results)
+        self.assertTrue(all(result.tzinfo == pytz.utc for result in results))
+
     def test_local_now(self):
         # Arrange
         # Act
@@ -343,6 +502,17 @@ class LiveClockTests(unittest.TestCase):
         self.assertEqual(float, type(result))
         self.assertTrue(result > 0)
 
+    def test_unix_time_ns(self):
+        # Arrange
+        # Act
+        before = self.clock.unix_time()
+        result = self.clock.unix_time_ns()
+        after = self.clock.unix_time()
+
+        # Assert
+        self.assertEqual(int, type(result))
+        self.assertTrue(int(before * 1e9) - 1000 <= result <= int(after * 1e9) + 1000)
+
     def test_set_time_alert(self):
         # Arrange
         name = "TEST_ALERT"
@@ -158,3 +158,20 @@ class TimerTests(unittest.TestCase):
         # Act
         # Assert
         self.assertRaises(NotImplementedError, timer.cancel)
+
+    def test_interval_and_next_time_in_nanoseconds(self):
+        # Arrange
+        receiver = []
+        timer = Timer(
+            "TIMER_1",
+            receiver.append,
+            timedelta(milliseconds=1500),
+            UNIX_EPOCH,
+        )
+
+        # Act
+        timer.iterate_next_time(timer.next_time)
+
+        # Assert
+        self.assertEqual(1_500_000_000, timer.interval_ns)
+        self.assertEqual(3_000_000_000, timer.next_time_ns)
@@ -15,8 +15,6 @@
 
 import unittest
 
-from parameterized import parameterized
-
 from nautilus_trader.core.cache import ObjectCache
 from nautilus_trader.model.identifiers import Symbol
 
@@ -33,20 +31,45 @@ class ObjectCacheTests(unittest.TestCase):
         self.assertEqual(Symbol, cache.type_value)
         self.assertEqual([], cache.keys())
 
-    @parameterized.expand([
-        [None, TypeError],
-        ["", ValueError],
-        [" ", ValueError],
-        ["  ", ValueError],
-        [1234, TypeError],
-    ])
-    def test_get_given_none_raises_value_error(self, value, ex):
+    def test_get_given_none_raises_type_error(self):
+        # Arrange
+        cache = ObjectCache(Symbol, Symbol.from_str)
+
+        # Act
+        # Assert
+        self.assertRaises(TypeError, cache.get, None)
+
+    def test_get_given_empty_string_raises_value_error(self):
+        # Arrange
+        cache = ObjectCache(Symbol, Symbol.from_str)
+
+        # Act
+        # Assert
+        self.assertRaises(ValueError, cache.get, "")
+
+    def test_get_given_whitespace_raises_value_error(self):
+        # Arrange
+        cache = ObjectCache(Symbol, Symbol.from_str)
+
+        # Act
+        # Assert
+        self.assertRaises(ValueError, cache.get, " ")
+
+    def test_get_given_multiple_whitespace_raises_value_error(self):
+        # Arrange
+        cache = ObjectCache(Symbol, Symbol.from_str)
+
+        # Act
+        # Assert
+        self.assertRaises(ValueError, cache.get, "  ")
+
+    def test_get_given_int_raises_type_error(self):
         # Arrange
         cache = ObjectCache(Symbol, Symbol.from_str)
 
         # Act
         # Assert
-        self.assertRaises(ex, cache.get, value)
+        self.assertRaises(TypeError, cache.get, 1234)
 
     def test_get_from_empty_cache(self):
         # Arrange
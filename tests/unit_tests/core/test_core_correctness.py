@@ -398,6 +398,8 @@ class ConditionTests(unittest.TestCase):
         self.assertRaises(ValueError, PyCondition.valid_string, "", "param")
         self.assertRaises(ValueError, PyCondition.valid_string, " ", "param")
         self.assertRaises(ValueError, PyCondition.valid_string, "   ", "param")
+        self.assertRaises(ValueError, PyCondition.valid_string, "\t\n", "param")
+        self.assertRaises(ValueError, PyCondition.valid_string, "\u3000", "param")
 
     def test_valid_string_with_valid_string_does_nothing(self):
         # Arrange
@@ -25,10 +25,13 @@ from nautilus_trader.core.datetime import as_utc_index
 from nautilus_trader.core.datetime import as_utc_timestamp
 from nautilus_trader.core.datetime import format_iso8601
 from nautilus_trader.core.datetime import from_posix_ms
+from nautilus_trader.core.datetime import from_posix_ns
 from nautilus_trader.core.datetime import is_datetime_utc
 from nautilus_trader.core.datetime import is_tz_aware
 from nautilus_trader.core.datetime import is_tz_naive
+from nautilus_trader.core.datetime import timedelta_to_ns
 from nautilus_trader.core.datetime import to_posix_ms
+from nautilus_trader.core.datetime import to_posix_ns
 from tests.test_kit.stubs import UNIX_EPOCH
 
 
@@ -62,6 +65,79 @@ class TestFunctionsTests(unittest.TestCase):
         # Assert
         self.assertEqual(expected, dt)
 
+    @parameterized.expand([
+        [datetime(1969, 12, 1, 1, 0, tzinfo=pytz.utc), -2674800000000000],
+        [datetime(1970, 1, 1, 0, 0, tzinfo=pytz.utc), 0],
+        [datetime(2013, 1, 1, 1, 0, tzinfo=pytz.utc), 1357002000000000000],
+        [datetime(2020, 1, 2, 3, 2, microsecond=1, tzinfo=pytz.utc), 1577934120000001000],
+    ])
+    def test_to_posix_ns_with_various_values_returns_expected_int(self, value, expected):
+        # Arrange
+        # Act
+        posix = to_posix_ns(value)
+
+        # Assert
+        self.assertEqual(expected, posix)
+
+    def test_to_posix_ns_with_tz_naive_datetime_treats_as_utc(self):
+        # Arrange
+        # Act
+        posix = to_posix_ns(datetime(2013, 1, 1, 1, 0))
+
+        # Assert
+        self.assertEqual(1357002000000000000, posix)
+
+    @parameterized.expand([
+        [datetime(2262, 4, 12, tzinfo=pytz.utc)],
+        [datetime(1677, 9, 21, tzinfo=pytz.utc)],
+        [datetime(9999, 12, 31)],
+    ])
+    def test_to_posix_ns_outside_int64_range_raises_overflow_error(self, value):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(OverflowError, to_posix_ns, value)
+
+    @parameterized.expand([
+        [-2674800000000000, datetime(1969, 12, 1, 1, 0, tzinfo=pytz.utc)],
+        [0, datetime(1970, 1, 1, 0, 0, tzinfo=pytz.utc)],
+        [1357002000000000000, datetime(2013, 1, 1, 1, 0, tzinfo=pytz.utc)],
+        [1577934120000001000, datetime(2020, 1, 2, 3, 2, 0, 1, tzinfo=pytz.utc)],
+    ])
+    def test_from_posix_ns_with_various_values_returns_expected_datetime(self, value, expected):
+        # Arrange
+        # Act
+        dt = from_posix_ns(value)
+
+        # Assert
+        self.assertEqual(expected, dt)
+
+    @parameterized.expand([
+        [timedelta(0), 0],
+        [timedelta(microseconds=1), 1000],
+        [timedelta(seconds=1), 1_000_000_000],
+        [timedelta(days=1, seconds=1, microseconds=1), 86_401_000_001_000],
+        [timedelta(seconds=-1), -1_000_000_000],
+    ])
+    def test_timedelta_to_ns_with_various_values_returns_expected_int(self, value, expected):
+        # Arrange
+        # Act
+        result = timedelta_to_ns(value)
+
+        # Assert
+        self.assertEqual(expected, result)
+
+    @parameterized.expand([
+        [timedelta(days=200000)],
+        [timedelta(days=-200000)],
+        [timedelta.max],
+    ])
+    def test_timedelta_to_ns_outside_int64_range_raises_overflow_error(self, value):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(OverflowError, timedelta_to_ns, value)
+
     def test_is_datetime_utc_given_tz_naive_datetime_returns_false(self):
         # Arrange
         dt = datetime(2013, 1, 1, 1, 0)
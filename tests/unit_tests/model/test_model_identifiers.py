@@ -15,12 +15,11 @@
 
 import unittest
 
-from parameterized import parameterized
-
 from nautilus_trader.model.identifiers import AccountId
 from nautilus_trader.model.identifiers import Brokerage
 from nautilus_trader.model.identifiers import ClientOrderId
 from nautilus_trader.model.identifiers import Exchange
+from nautilus_trader.model.identifiers import IdTag
 from nautilus_trader.model.identifiers import Identifier
 from nautilus_trader.model.identifiers import Issuer
 from nautilus_trader.model.identifiers import OrderId
@@ -33,18 +32,35 @@ from nautilus_trader.model.identifiers import Venue
 
 class IdentifierTests(unittest.TestCase):
 
-    @parameterized.expand([
-        [None, TypeError],
-        ["", ValueError],
-        [" ", ValueError],
-        ["  ", ValueError],
-        [1234, TypeError],
-    ])
-    def test_instantiate_given_various_invalid_values_raises_exception(self, value, ex):
+    def test_instantiate_given_none_raises_type_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(TypeError, Identifier, None)
+
+    def test_instantiate_given_empty_string_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(ValueError, Identifier, "")
+
+    def test_instantiate_given_whitespace_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(ValueError, Identifier, " ")
+
+    def test_instantiate_given_multiple_whitespace_raises_value_error(self):
         # Arrange
         # Act
         # Assert
-        self.assertRaises(ex, Identifier, value)
+        self.assertRaises(ValueError, Identifier, "  ")
+
+    def test_instantiate_given_int_raises_type_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(TypeError, Identifier, 1234)
 
     def test_equality(self):
         # Arrange
@@ -103,6 +119,29 @@ class IdentifierTests(unittest.TestCase):
         self.assertEqual(int, type(hash(identifier1)))
         self.assertEqual(hash(identifier1), hash(identifier2))
 
+    def test_identifiers_have_no_instance_dict(self):
+        # Arrange
+        identifiers = [
+            Identifier("abc"),
+            Symbol("AUD/USD", Venue("SIM")),
+            Venue("SIM"),
+            Exchange("NYSE"),
+            Brokerage("IB"),
+            IdTag("001"),
+            TraderId("TESTER", "000"),
+            StrategyId("S", "001"),
+            Issuer("FXCM"),
+            AccountId("FXCM", "02851908"),
+            ClientOrderId("O-123456"),
+            OrderId("1"),
+            PositionId("P-123456"),
+        ]
+
+        # Act
+        # Assert
+        for identifier in identifiers:
+            self.assertFalse(hasattr(identifier, "__dict__"), type(identifier).__name__)
+
     def test_identifier_equality(self):
         # Arrange
         id1 = Identifier("some-id-1")
@@ -188,6 +227,30 @@ class IdentifierTests(unittest.TestCase):
         # Assert
         self.assertEqual(symbol, result)
 
+    def test_parse_symbol_from_str_splits_on_first_period(self):
+        # Arrange
+        # Act
+        result = Symbol.from_str("BRK.B.NYSE")
+
+        # Assert
+        self.assertEqual("BRK", result.code)
+        self.assertEqual(Venue("B.NYSE"), result.venue)
+
+    def test_parsed_symbols_share_venue_instance(self):
+        # Arrange
+        # Act
+        symbol1 = Symbol.from_str("AUD/USD.SIM")
+        symbol2 = Symbol.from_str("GBP/USD.SIM")
+
+        # Assert
+        self.assertIs(symbol1.venue, symbol2.venue)
+
+    def test_symbol_given_malformed_string_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(ValueError, Symbol.from_str, "BAD_STRING")
+
     def test_account_id_given_malformed_string_raises_value_error(self):
         # Arrange
         # Act
@@ -219,6 +282,16 @@ class IdentifierTests(unittest.TestCase):
         self.assertEqual("TESTER", trader_id1.name)
         self.assertEqual(trader_id1, TraderId.from_str("TESTER-000"))
 
+    def test_trader_identifier_name_and_tag_given_hyphenated_name(self):
+        # Arrange
+        # Act
+        trader_id = TraderId("TESTER-A", "000")
+
+        # Assert
+        self.assertEqual("TESTER-A-000", trader_id.value)
+        self.assertEqual("TESTER-A", trader_id.name)
+        self.assertEqual(IdTag("000"), trader_id.tag)
+
     def test_strategy_identifier(self):
         # Arrange
         # Act
@@ -245,6 +318,22 @@ class IdentifierTests(unittest.TestCase):
         self.assertEqual(Issuer("SIM"), account_id1.issuer)
         self.assertEqual(account_id1, AccountId("SIM", "02851908"))
 
+    def test_account_identifier_given_invalid_identifier_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(ValueError, AccountId, "SIM", "")
+        self.assertRaises(ValueError, AccountId, "", "02851908")
+
+    def test_account_identifier_issuer_and_identifier(self):
+        # Arrange
+        # Act
+        account_id = AccountId("SIM", "02851908")
+
+        # Assert
+        self.assertEqual(Issuer("SIM"), account_id.issuer)
+        self.assertEqual(Identifier("02851908"), account_id.identifier)
+
     def test_position_identifier(self):
         # Arrange
         # Act